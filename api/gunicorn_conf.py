@@ -0,0 +1,31 @@
+"""Gunicorn configuration for the omics-demo API server.
+
+Usage:
+    gunicorn -c api/gunicorn_conf.py api.server:app
+"""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+# Patch the standard library before the app (and with it boto3/urllib3) is
+# preloaded, so AWS calls yield to other requests while waiting on the network
+from gevent import monkey
+
+monkey.patch_all()
+
+import logging  # noqa: E402
+import multiprocessing  # noqa: E402
+import os  # noqa: E402
+
+from api.logging_config import LOG_FORMAT  # noqa: E402
+
+# The app leaves logging setup to its host; workers inherit this root handler
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gevent'
+worker_connections = 1000
+
+# Import the app once in the master; AWS clients are still created lazily in
+# each worker, since boto3 clients must not be shared across a fork
+preload_app = True
@@ -0,0 +1,6 @@
+"""Logging settings shared by the API's hosts (gunicorn and the dev server)."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+# Kept free of app imports so gunicorn_conf can use it without loading the app
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
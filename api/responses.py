@@ -0,0 +1,23 @@
+"""JSON response helpers for API endpoints."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import orjson
+from flask import current_app
+
+
+def json_response(payload, status=200):
+    """Build a JSON response, serializing the payload with orjson.
+    
+    Args:
+        payload: A JSON-serializable object
+        status: HTTP status code for the response
+        
+    Returns:
+        A Flask response with an application/json body
+    """
+    return current_app.response_class(
+        orjson.dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
@@ -7,24 +7,28 @@ Provides secure access to AWS resources and demo status
 """
 
 import os
-import json
+import shlex
 import time
 import logging
-import traceback
-from datetime import datetime
-import boto3
-import yaml
-from flask import Flask, jsonify, request, abort
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+import numpy as np
+from cachetools import TTLCache
+from cachetools.func import ttl_cache
+import orjson
+from flask import Flask, request, abort
 from flask_cors import CORS
 
-# Import validators
+# Import response helpers and validators
+from api.logging_config import LOG_FORMAT
+from api.responses import json_response
 from api.validators import validate_json, START_DEMO_SCHEMA
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by whatever hosts the app (gunicorn, pytest, __main__)
 logger = logging.getLogger('omics-api')
 
 # Initialize Flask app
@@ -38,9 +42,22 @@ DEFAULT_BUCKET = 'omics-demo-bucket'
 DEFAULT_PROFILE = 'default'
 STACK_NAME = 'omics-demo'
 
+# config.sh keys we care about, mapped to their names in the config dict
+CONFIG_KEYS = {
+    'REGION': 'region',
+    'BUCKET_NAME': 'bucket',
+    'AWS_PROFILE': 'profile',
+    'STACK_NAME': 'stack_name'
+}
+
 # Parse config.sh to get AWS settings
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.sh file."""
+    """Load configuration from config.sh file.
+
+    The file is parsed once per process; later calls return the cached,
+    read-only mapping.
+    """
     config = {
         'region': DEFAULT_REGION,
         'bucket': DEFAULT_BUCKET,
@@ -51,93 +68,294 @@ def load_config():
     try:
         if os.path.exists(CONFIG_PATH):
             with open(CONFIG_PATH, 'r') as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        if key == 'REGION':
-                            config['region'] = value
-                        elif key == 'BUCKET_NAME':
-                            config['bucket'] = value
-                        elif key == 'AWS_PROFILE':
-                            config['profile'] = value
-                        elif key == 'STACK_NAME':
-                            config['stack_name'] = value
+                # Tokenize like the shell does, so quoting, comments and
+                # `export KEY=value` lines are handled the same way
+                tokens = shlex.split(f.read(), comments=True)
+            assignments = dict(token.split('=', 1) for token in tokens if '=' in token)
+            config.update({
+                name: assignments[key]
+                for key, name in CONFIG_KEYS.items()
+                if key in assignments
+            })
     except Exception as e:
-        logger.error(f"Error loading config: {str(e)}")
+        logger.error("Error loading config: %s", e)
     
-    return config
+    return MappingProxyType(config)
 
 config = load_config()
 
 # Initialize AWS clients
+# Shared botocore settings for every client; a larger pool lets concurrent
+# requests reuse warm connections instead of queueing on the default 10, and
+# TCP keep-alive lets idle connections survive between dashboard polls.
+BOTO_CONFIG_OPTIONS = {
+    'max_pool_connections': 50,
+    'retries': {'mode': 'adaptive', 'max_attempts': 5},
+    'connect_timeout': 1,
+    'read_timeout': 5,
+    'tcp_keepalive': True
+}
+
+# Worker pool for issuing independent AWS calls concurrently; boto3 releases
+# the GIL while waiting on the network, so the round-trips overlap. Views stay
+# synchronous on purpose: Flask runs async views in a fresh event loop per
+# request, so aioboto3 clients could not be cached and reused like these.
+# The pool is shared by every endpoint that fans out and reuses its threads
+# across requests. It is deliberately not prewarmed: threads start lazily on
+# the first fan-out, since gunicorn imports this module in the master
+# (preload_app) and threads started there would not survive the fork.
+_aws_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='aws')
+
+# boto3 sessions and clients are not thread-safe to create; the lock serializes
+# the first lookup per service (cache hits only hold it for a dict lookup)
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Create the boto3 session shared by every AWS client."""
+    # Imported here so endpoints that never touch AWS don't pay for loading boto3
+    import boto3
+    
+    return boto3.Session(profile_name=config['profile'], region_name=config['region'])
+
+@functools.lru_cache(maxsize=None)
+def _make_client(service_name):
+    """Create and cache one AWS client per service from the shared session."""
+    from botocore.config import Config
+    
+    return _get_session().client(service_name, config=Config(**BOTO_CONFIG_OPTIONS))
+
 def get_aws_client(service_name):
-    """Create an AWS client for the specified service."""
+    """Get the shared AWS client for the specified service."""
     try:
-        session = boto3.Session(profile_name=config['profile'], region_name=config['region'])
-        return session.client(service_name)
+        with _client_lock:
+            return _make_client(service_name)
     except Exception as e:
-        logger.error(f"Error creating AWS client for {service_name}: {str(e)}")
+        logger.error("Error creating AWS client for %s: %s", service_name, e)
         return None
 
+def count_jobs(batch, queue_name, job_status):
+    """Count the jobs in a queue with the given status across all result pages."""
+    paginator = batch.get_paginator('list_jobs')
+    pages = paginator.paginate(jobQueue=queue_name, jobStatus=job_status)
+    return sum(len(page['jobSummaryList']) for page in pages)
+
+# Job definitions change rarely, so their lookup is cached for a minute
+JOB_DEFINITION_CACHE_TTL = 60  # seconds
+
+@ttl_cache(maxsize=8, ttl=JOB_DEFINITION_CACHE_TTL)
+def describe_job_definition(name):
+    """Look up the active revisions of a job definition, caching the result."""
+    return get_aws_client('batch').describe_job_definitions(jobDefinitionName=name, status='ACTIVE')
+
+# CloudWatch series behind /api/resources as (query id, metric name, response
+# field); the AWS/Batch metrics the stack's dashboard charts for the CPU job
+# queue. GPUUtilization is only reported for the GPU queue, which the API has
+# no name for, so GPU utilization stays simulated.
+RESOURCE_METRICS = (
+    ('cpu', 'CPUUtilization', 'cpuUtilization'),
+    ('memory', 'MemoryUtilization', 'memoryUtilization')
+)
+RESOURCE_METRIC_PERIOD = 60  # seconds
+RESOURCE_METRIC_WINDOW = timedelta(minutes=15)
+# The metrics are best-effort, so /api/resources (and every poller waiting on
+# its fetch lock) falls back to mock data rather than sit through retries
+RESOURCE_METRIC_TIMEOUT = 2  # seconds
+
+def get_resource_metrics(cloudwatch, queue_name):
+    """Fetch the latest resource utilization for a job queue from CloudWatch.
+    
+    All series are requested in a single get_metric_data call.
+    
+    Args:
+        cloudwatch: CloudWatch client
+        queue_name: Name of the AWS Batch job queue
+        
+    Returns:
+        A dict mapping response field names to their most recent value, for
+        the metrics that have datapoints in the window
+    """
+    end_time = datetime.now(timezone.utc)
+    response = cloudwatch.get_metric_data(
+        MetricDataQueries=[
+            {
+                'Id': metric_id,
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Batch',
+                        'MetricName': metric_name,
+                        'Dimensions': [{'Name': 'JobQueue', 'Value': queue_name}]
+                    },
+                    'Period': RESOURCE_METRIC_PERIOD,
+                    'Stat': 'Average'
+                }
+            }
+            for metric_id, metric_name, _ in RESOURCE_METRICS
+        ],
+        StartTime=end_time - RESOURCE_METRIC_WINDOW,
+        EndTime=end_time,
+        ScanBy='TimestampDescending'
+    )
+    
+    fields = {metric_id: field for metric_id, _, field in RESOURCE_METRICS}
+    return {
+        fields[result['Id']]: result['Values'][0]
+        for result in response['MetricDataResults']
+        if result['Values']
+    }
+
+# Simulate CPU scaling pattern similar to the frontend simulation
+def simulate_cpu_count(time_minutes):
+    """Return the simulated vCPU count at a point in the 15 minute demo window."""
+    if time_minutes < 1:
+        return int(time_minutes * 20)
+    if time_minutes < 3:
+        return int(20 + (time_minutes - 1) * 70)
+    if time_minutes < 8:
+        return 160
+    if time_minutes < 10:
+        return int(160 - (time_minutes - 8) * 60)
+    return int(40 - (min(time_minutes, 13) - 10) * 10)
+
+# simulate_cpu_count() sampled every 0.01 minutes across the 15 minute window
+CPU_COUNT_TABLE = np.fromiter((simulate_cpu_count(t / 100.0) for t in range(1500)), dtype=np.int32)
+
+# Noise ranges for simulated CPU, memory and GPU utilization
+UTIL_NOISE_LOW = np.array([-5.0, -10.0, -5.0])
+UTIL_NOISE_HIGH = np.array([15.0, 20.0, 15.0])
+_rng = np.random.default_rng()
+
 # Error handler for API exceptions
 @app.errorhandler(Exception)
 def handle_exception(e):
     """Handle exceptions and return appropriate error responses."""
     if isinstance(e, ValueError):
-        return jsonify(error=str(e)), 400
+        return json_response({'error': str(e)}, 400)
     
     # Log the full exception for server-side errors
-    logger.error(f"Unhandled exception: {str(e)}")
-    logger.error(traceback.format_exc())
+    logger.exception("Unhandled exception: %s", e)
     
     # Return a generic error message to the client
-    return jsonify(error="An internal server error occurred"), 500
+    return json_response({'error': "An internal server error occurred"}, 500)
+
+# Short-lived cache for the AWS-backed GET endpoints, keyed by route. The
+# dashboard polls these every few seconds; caching keeps repeated polls from
+# turning into repeated AWS round-trips (and Batch/CloudWatch throttling).
+RESPONSE_CACHE_TTL = 3  # seconds
+_response_cache = TTLCache(maxsize=16, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+_fetch_locks = {}
+
+def cached_response(key, fetch):
+    """Serve a JSON response from the TTL cache, calling fetch() on a miss.
+
+    Only successful (200) results are cached. Concurrent misses for the same
+    key wait for a single fetch instead of each calling AWS.
+
+    Args:
+        key: Cache key, one per route
+        fetch: Callable returning a (payload, status_code) tuple
+
+    Returns:
+        A Flask response with ETag/Last-Modified set from the fetch time, or
+        a 304 if the client already has the current version
+    """
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        fetch_lock = _fetch_locks.setdefault(key, threading.Lock())
+    
+    if entry is None:
+        with fetch_lock:
+            with _response_cache_lock:
+                entry = _response_cache.get(key)
+            if entry is None:
+                payload, status_code = fetch()
+                if status_code != 200:
+                    return json_response(payload, status_code)
+                entry = (time.time(), payload)
+                with _response_cache_lock:
+                    _response_cache[key] = entry
+    
+    fetched_at, payload = entry
+    response = json_response(payload)
+    response.set_etag(f"{key}-{fetched_at:.6f}")
+    response.last_modified = datetime.fromtimestamp(fetched_at, timezone.utc)
+    return response.make_conditional(request)
+
+def invalidate_cached_response(*keys):
+    """Drop cached responses for the given keys, or all of them if none are given."""
+    with _response_cache_lock:
+        if not keys:
+            _response_cache.clear()
+        for key in keys:
+            _response_cache.pop(key, None)
 
 # Routes
+# The config payload only changes on restart, so serialize it and derive its
+# ETag once; clients can cache it and revalidate with If-None-Match
+CONFIG_BODY = orjson.dumps({
+    'region': config['region'],
+    'bucket': config['bucket'],
+    'profile': config['profile'],
+    'stackName': config['stack_name'],
+    'simulation': False  # Real mode by default
+})
+CONFIG_ETAG = hashlib.md5(CONFIG_BODY).hexdigest()
+CONFIG_MAX_AGE = 300  # seconds
+HEALTH_MAX_AGE = 10  # seconds
+
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get API configuration."""
-    return jsonify({
-        'region': config['region'],
-        'bucket': config['bucket'],
-        'profile': config['profile'],
-        'stackName': config['stack_name'],
-        'simulation': False  # Real mode by default
-    })
+    response = app.response_class(CONFIG_BODY, mimetype='application/json')
+    response.set_etag(CONFIG_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = CONFIG_MAX_AGE
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get demo job status."""
+    return cached_response('status', fetch_status)
+
+def fetch_status():
+    """Fetch demo job status from AWS.
+
+    Returns:
+        A (payload, status_code) tuple
+    """
     try:
         batch = get_aws_client('batch')
         if not batch:
-            return jsonify({'status': 'ERROR', 'message': 'AWS Batch client not available'}), 500
+            return {'status': 'ERROR', 'message': 'AWS Batch client not available'}, 500
         
-        # Get job queue
+        # Count the queue's jobs for each status concurrently
         queue_name = f"{config['stack_name']}-queue"
-        job_queues = batch.describe_job_queues(jobQueues=[queue_name])
-        
-        if not job_queues['jobQueues']:
-            return jsonify({'status': 'NOT_FOUND', 'message': 'Job queue not found'}), 404
+        job_counts = _aws_executor.map(
+            lambda job_status: count_jobs(batch, queue_name, job_status),
+            ('RUNNING', 'SUCCEEDED', 'FAILED')
+        )
         
-        # Get running jobs
-        running_jobs = batch.list_jobs(jobQueue=queue_name, jobStatus='RUNNING')
-        completed_jobs = batch.list_jobs(jobQueue=queue_name, jobStatus='SUCCEEDED')
-        failed_jobs = batch.list_jobs(jobQueue=queue_name, jobStatus='FAILED')
+        try:
+            running_count, completed_count, failed_count = job_counts
+        except batch.exceptions.ClientException:
+            # AWS Batch rejects list_jobs for a job queue that doesn't exist
+            return {'status': 'NOT_FOUND', 'message': 'Job queue not found'}, 404
         
         # Determine status
-        if running_jobs['jobSummaryList']:
+        if running_count:
             status = 'RUNNING'
-            message = f"Processing samples... ({len(running_jobs['jobSummaryList'])} jobs running)"
-            completed_samples = len(completed_jobs['jobSummaryList'])
-        elif failed_jobs['jobSummaryList'] and not completed_jobs['jobSummaryList']:
+            message = f"Processing samples... ({running_count} jobs running)"
+            completed_samples = completed_count
+        elif failed_count and not completed_count:
             status = 'FAILED'
-            message = f"Demo failed with {len(failed_jobs['jobSummaryList'])} failed jobs"
-            completed_samples = len(completed_jobs['jobSummaryList'])
-        elif completed_jobs['jobSummaryList']:
+            message = f"Demo failed with {failed_count} failed jobs"
+            completed_samples = completed_count
+        elif completed_count:
             status = 'COMPLETED'
-            message = f"Analysis completed with {len(completed_jobs['jobSummaryList'])} successful jobs"
-            completed_samples = len(completed_jobs['jobSummaryList'])
+            message = f"Analysis completed with {completed_count} successful jobs"
+            completed_samples = completed_count
         else:
             status = 'READY'
             message = 'Demo ready to start'
@@ -152,97 +370,111 @@ def get_status():
                 # from CloudWatch metrics for the Batch compute environment
                 cost_accrued = 0.0
             except Exception as e:
-                logger.error(f"Error getting cost metrics: {str(e)}")
+                logger.error("Error getting cost metrics: %s", e)
         
-        return jsonify({
+        return {
             'status': status,
             'message': message,
             'completedSamples': completed_samples,
             'totalSamples': 100,  # Hardcoded for demo
             'costAccrued': cost_accrued
-        })
+        }, 200
         
     except Exception as e:
-        logger.error(f"Error getting status: {str(e)}\n{traceback.format_exc()}")
-        return jsonify({'status': 'ERROR', 'message': str(e)}), 500
+        logger.exception("Error getting status: %s", e)
+        return {'status': 'ERROR', 'message': str(e)}, 500
 
 @app.route('/api/resources', methods=['GET'])
 def get_resources():
     """Get resource utilization."""
+    return cached_response('resources', fetch_resources)
+
+def fetch_resources():
+    """Fetch resource utilization from AWS.
+
+    Returns:
+        A (payload, status_code) tuple
+    """
     try:
         cloudwatch = get_aws_client('cloudwatch')
         if not cloudwatch:
-            return jsonify({'error': 'CloudWatch client not available'}), 500
+            return {'error': 'CloudWatch client not available'}, 500
         
-        # In a real implementation, we would query CloudWatch for:
-        # - CPU utilization
-        # - Memory utilization
-        # - GPU utilization
-        # - Number of instances
+        # Query CloudWatch for CPU and memory utilization in one request; a
+        # timed-out call is left to finish on the pool in the background
+        future = _aws_executor.submit(get_resource_metrics, cloudwatch,
+                                      f"{config['stack_name']}-queue")
+        try:
+            metrics = future.result(timeout=RESOURCE_METRIC_TIMEOUT)
+        except FuturesTimeoutError:
+            logger.warning("Resource metrics took longer than %ss, using mock data",
+                           RESOURCE_METRIC_TIMEOUT)
+            metrics = {}
+        except Exception as e:
+            logger.warning("Could not get resource metrics, using mock data: %s", e)
+            metrics = {}
         
-        # For this demo, we'll return mock data
+        # Mock data for the instance count, GPU utilization and any metric without datapoints
         current_time = time.time()
         time_minutes = current_time % 15  # Mock time within a 15 minute window
-        
-        # Simulate CPU scaling pattern similar to the frontend simulation
-        def simulate_cpu_count(time_minutes):
-            if time_minutes < 1: 
-                return int(time_minutes * 20)
-            if time_minutes < 3: 
-                return int(20 + (time_minutes - 1) * 70)
-            if time_minutes < 8: 
-                return 160
-            if time_minutes < 10: 
-                return int(160 - (time_minutes - 8) * 60)
-            return int(40 - (min(time_minutes, 13) - 10) * 10)
+        cpu_count = int(CPU_COUNT_TABLE[min(int(time_minutes * 100), len(CPU_COUNT_TABLE) - 1)])
         
         # Simulate utilization with some noise
-        import random
-        cpu_count = simulate_cpu_count(time_minutes)
-        cpu_util = 75 + random.uniform(-5, 15)
-        mem_util = 60 + random.uniform(-10, 20)
-        gpu_util = 0 if time_minutes < 10 else (80 + random.uniform(-5, 15))
+        cpu_noise, mem_noise, gpu_noise = _rng.uniform(UTIL_NOISE_LOW, UTIL_NOISE_HIGH)
+        cpu_util = 75 + float(cpu_noise)
+        mem_util = 60 + float(mem_noise)
+        gpu_util = 0 if time_minutes < 10 else (80 + float(gpu_noise))
         
-        return jsonify({
+        resources = {
             'time': time_minutes,
             'cpuCount': cpu_count,
             'cpuUtilization': cpu_util,
             'memoryUtilization': mem_util,
             'gpuUtilization': gpu_util
-        })
+        }
+        resources.update(metrics)
+        return resources, 200
         
     except Exception as e:
-        logger.error(f"Error getting resources: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Error getting resources: %s", e)
+        return {'error': str(e)}, 500
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get variant statistics."""
+    return cached_response('stats', fetch_stats)
+
+def fetch_stats():
+    """Fetch variant statistics from AWS.
+
+    Returns:
+        A (payload, status_code) tuple
+    """
     try:
         s3 = get_aws_client('s3')
         if not s3:
-            return jsonify({'error': 'S3 client not available'}), 500
+            return {'error': 'S3 client not available'}, 500
         
         # Try to get real stats from S3
         try:
             stats_key = 'results/stats/stats.json'
             response = s3.get_object(Bucket=config['bucket'], Key=stats_key)
-            stats_data = json.loads(response['Body'].read().decode('utf-8'))
-            return jsonify(stats_data)
+            stats_data = orjson.loads(response['Body'].read())
+            return stats_data, 200
         except Exception as e:
-            logger.warning(f"Could not get real stats, using mock data: {str(e)}")
+            logger.warning("Could not get real stats, using mock data: %s", e)
         
         # Return mock stats if real data isn't available
-        return jsonify({
+        return {
             'totalVariants': 243826,
             'transitions': 167538,
             'transversions': 76288,
             'tiTvRatio': 2.196
-        })
+        }, 200
         
     except Exception as e:
-        logger.error(f"Error getting stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Error getting stats: %s", e)
+        return {'error': str(e)}, 500
 
 @app.route('/api/start', methods=['POST'])
 @validate_json(START_DEMO_SCHEMA)
@@ -252,14 +484,14 @@ def start_demo():
         # Check if AWS Batch is available
         batch = get_aws_client('batch')
         if not batch:
-            return jsonify({'error': 'AWS Batch client not available'}), 500
+            return json_response({'error': 'AWS Batch client not available'}, 500)
         
         # Create job definition if it doesn't exist
         job_definition_name = f"{config['stack_name']}-job-def"
         try:
-            batch.describe_job_definitions(jobDefinitionName=job_definition_name, status='ACTIVE')
+            describe_job_definition(job_definition_name)
         except batch.exceptions.ClientException:
-            logger.info(f"Creating job definition {job_definition_name}")
+            logger.info("Creating job definition %s", job_definition_name)
             # This would actually create the job definition in a real implementation
         
         # Submit the job
@@ -268,12 +500,12 @@ def start_demo():
             
             # Validate job name
             if not job_name or len(job_name) > 128:
-                return jsonify({'error': 'Invalid job name'}), 400
+                return json_response({'error': 'Invalid job name'}, 400)
                 
             # Validate job queue
             job_queue = f"{config['stack_name']}-queue"
             if not job_queue:
-                return jsonify({'error': 'Invalid job queue'}), 400
+                return json_response({'error': 'Invalid job queue'}, 400)
                 
             response = batch.submit_job(
                 jobName=job_name,
@@ -293,30 +525,43 @@ def start_demo():
                 }
             )
             
-            return jsonify({
+            # The queue now has a new job; don't serve a stale status
+            invalidate_cached_response('status')
+            
+            return json_response({
                 'success': True,
                 'jobId': response['jobId'],
                 'message': 'Demo started successfully'
             })
             
         except Exception as e:
-            logger.error(f"Error submitting job: {str(e)}")
-            return jsonify({'error': f"Failed to submit job: {str(e)}"}), 500
+            logger.error("Error submitting job: %s", e)
+            return json_response({'error': f"Failed to submit job: {str(e)}"}, 500)
         
     except Exception as e:
-        logger.error(f"Error starting demo: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Error starting demo: %s", e)
+        return json_response({'error': str(e)}, 500)
 
 # Health check endpoint
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring."""
-    return jsonify({
+    response = json_response({
         'status': 'healthy',
         'timestamp': datetime.utcnow().isoformat(),
         'version': '1.0.0'
     })
+    response.cache_control.public = True
+    response.cache_control.max_age = HEALTH_MAX_AGE
+    return response
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    # Development server only; production runs under gunicorn (api/gunicorn_conf.py)
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    app.run(
+        host='0.0.0.0',
+        port=port,
+        debug=os.environ.get('FLASK_DEBUG') == '1',
+        threaded=True
+    )
@@ -3,7 +3,26 @@
 # SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
 
 from functools import wraps
-from flask import request, jsonify
+from flask import request
+
+from api.responses import json_response
+
+
+def compile_schema(schema):
+    """Resolve a validation schema into a list of rules once, up front.
+    
+    Args:
+        schema: A dict with field names and types or validation functions
+        
+    Returns:
+        A list of (field, validator, is_type) tuples, where is_type says whether
+        validator is a type to check with isinstance() or a function to call
+    """
+    # Types are callable too, so decide here rather than with callable()
+    return [
+        (field, validator, isinstance(validator, type))
+        for field, validator in schema.items()
+    ]
 
 
 def validate_json(schema):
@@ -15,29 +34,37 @@ def validate_json(schema):
     Returns:
         A decorator function that validates request.json
     """
+    rules = compile_schema(schema)
+    
     def decorator(func):
+        # Nothing to validate, so don't touch the request body at all
+        if not rules:
+            return func
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Check if request includes JSON data when required
-            if not request.json and schema:
-                return jsonify({"error": "Missing JSON in request"}), 400
+            payload = request.get_json(cache=True, silent=True)
+            if not payload:
+                return json_response({"error": "Missing JSON in request"}, 400)
                 
             # Check if all required fields are present
-            for field, validator in schema.items():
-                if field not in request.json:
-                    return jsonify({"error": f"Missing required field: {field}"}), 400
+            for field, validator, is_type in rules:
+                if field not in payload:
+                    return json_response({"error": f"Missing required field: {field}"}, 400)
                 
-                # Validate field value if validator is a function
-                if callable(validator):
-                    if not validator(request.json[field]):
-                        return jsonify({"error": f"Invalid value for field: {field}"}), 400
+                value = payload[field]
                 # Validate field type if validator is a type
-                elif not isinstance(request.json[field], validator):
-                    expected_type = validator.__name__
-                    actual_type = type(request.json[field]).__name__
-                    return jsonify({
-                        "error": f"Invalid type for field: {field}. Expected {expected_type}, got {actual_type}"
-                    }), 400
+                if is_type:
+                    if not isinstance(value, validator):
+                        expected_type = validator.__name__
+                        actual_type = type(value).__name__
+                        return json_response({
+                            "error": f"Invalid type for field: {field}. Expected {expected_type}, got {actual_type}"
+                        }, 400)
+                # Validate field value if validator is a function
+                elif not validator(value):
+                    return json_response({"error": f"Invalid value for field: {field}"}, 400)
             
             return func(*args, **kwargs)
         return wrapper
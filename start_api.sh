@@ -32,4 +32,4 @@ fi
 
 # Start the API server
 echo "Starting API server at http://localhost:5000..."
-python3 api/server.py
\ No newline at end of file
+gunicorn -c api/gunicorn_conf.py api.server:app
\ No newline at end of file
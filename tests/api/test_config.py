@@ -15,4 +15,40 @@ def test_config_endpoint(client):
     assert "bucket" in data
     assert "stackName" in data
     assert "simulation" in data
-    assert data["simulation"] is False
\ No newline at end of file
+    assert data["simulation"] is False
+
+
+def test_load_config_parses_config_file(tmp_path, monkeypatch):
+    """Test that load_config reads known keys from config.sh and caches the result."""
+    from api import server
+
+    config_file = tmp_path / "config.sh"
+    config_file.write_text(
+        "#!/bin/bash\n"
+        "# REGION=commented-out\n"
+        "BUCKET_NAME=my-bucket\n"
+        "REGION=eu-west-1  # trailing comment\n"
+        "export AWS_PROFILE='demo profile'\n"
+        "API_PORT=5000\n"
+    )
+    monkeypatch.setattr(server, "CONFIG_PATH", str(config_file))
+    server.load_config.cache_clear()
+    try:
+        loaded = server.load_config()
+        assert loaded["bucket"] == "my-bucket"
+        assert loaded["region"] == "eu-west-1"
+        assert loaded["profile"] == "demo profile"
+        assert loaded["stack_name"] == server.STACK_NAME
+        assert server.load_config() is loaded
+    finally:
+        server.load_config.cache_clear()
+
+
+def test_config_endpoint_is_cacheable(client):
+    """Test that the config endpoint can be cached and revalidated by clients."""
+    response = client.get("/api/config")
+    assert response.cache_control.max_age == 300
+    etag = response.headers["ETag"]
+
+    revalidated = client.get("/api/config", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
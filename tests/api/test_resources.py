@@ -0,0 +1,74 @@
+"""Test the API resources endpoint."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import json
+import threading
+import time
+
+
+class FakeCloudWatch:
+    """Minimal stand-in for the CloudWatch client."""
+
+    def __init__(self, values=None, error=None, hang_until=None):
+        self.values = values or {}
+        self.error = error
+        self.hang_until = hang_until
+        self.requests = []
+
+    def get_metric_data(self, MetricDataQueries, **kwargs):
+        self.requests.append(MetricDataQueries)
+        if self.hang_until:
+            self.hang_until.wait()
+        if self.error:
+            raise self.error
+        return {'MetricDataResults': [
+            {'Id': query['Id'], 'Values': self.values.get(query['Id'], [])}
+            for query in MetricDataQueries
+        ]}
+
+
+def test_resources_use_cloudwatch_metrics(client, aws_clients):
+    """Test that all metrics come from one request and real datapoints are used."""
+    cloudwatch = FakeCloudWatch(values={'cpu': [42.0, 10.0]})
+    aws_clients(cloudwatch=cloudwatch)
+
+    response = client.get("/api/resources")
+    assert response.status_code == 200
+    assert len(cloudwatch.requests) == 1
+    assert {query['Id'] for query in cloudwatch.requests[0]} == {'cpu', 'memory'}
+
+    data = json.loads(response.data)
+    assert data["cpuUtilization"] == 42.0
+    assert "memoryUtilization" in data
+    assert "cpuCount" in data
+
+
+def test_resources_fall_back_to_mock_data(client, aws_clients):
+    """Test that CloudWatch errors fall back to simulated utilization."""
+    aws_clients(cloudwatch=FakeCloudWatch(error=RuntimeError("throttled")))
+
+    response = client.get("/api/resources")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert 55 <= data["cpuUtilization"] <= 95
+
+
+def test_resources_do_not_wait_on_slow_cloudwatch(client, aws_clients, monkeypatch):
+    """Test that a hanging CloudWatch call falls back to mock data after the timeout."""
+    from api import server
+
+    monkeypatch.setattr(server, "RESOURCE_METRIC_TIMEOUT", 0.1)
+    released = threading.Event()
+    aws_clients(cloudwatch=FakeCloudWatch(values={'cpu': [42.0]}, hang_until=released))
+
+    try:
+        start = time.monotonic()
+        response = client.get("/api/resources")
+        elapsed = time.monotonic() - start
+    finally:
+        released.set()
+
+    assert response.status_code == 200
+    assert elapsed < 1
+    assert json.loads(response.data)["cpuUtilization"] != 42.0
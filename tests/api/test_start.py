@@ -0,0 +1,52 @@
+"""Test the API start endpoint."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import json
+
+from conftest import FakeAWSClient
+
+
+class FakeBatch(FakeAWSClient):
+    """Minimal stand-in for the AWS Batch client used to start the demo."""
+
+    def __init__(self, job_definition_exists=True):
+        self.job_definition_exists = job_definition_exists
+        self.describe_calls = 0
+        self.submitted = []
+
+    def describe_job_definitions(self, jobDefinitionName, status):
+        self.describe_calls += 1
+        if not self.job_definition_exists:
+            raise self.exceptions.ClientException(f"{jobDefinitionName} not found")
+        return {'jobDefinitions': [{'jobDefinitionName': jobDefinitionName, 'status': status}]}
+
+    def submit_job(self, jobName, **kwargs):
+        self.submitted.append(jobName)
+        return {'jobId': f"job-{len(self.submitted)}", 'jobName': jobName}
+
+
+def test_start_caches_job_definition_lookup(client, aws_clients):
+    """Test that a second start reuses the cached job definition lookup."""
+    batch = FakeBatch()
+    aws_clients(batch=batch)
+
+    for _ in range(2):
+        response = client.post("/api/start", json={})
+        assert response.status_code == 200
+        assert json.loads(response.data)["success"] is True
+
+    assert batch.describe_calls == 1
+    assert len(batch.submitted) == 2
+
+
+def test_start_does_not_cache_missing_job_definition(client, aws_clients):
+    """Test that a failed job definition lookup is retried on the next start."""
+    batch = FakeBatch(job_definition_exists=False)
+    aws_clients(batch=batch)
+
+    for _ in range(2):
+        response = client.post("/api/start", json={})
+        assert response.status_code == 200
+
+    assert batch.describe_calls == 2
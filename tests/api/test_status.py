@@ -0,0 +1,82 @@
+"""Test the API status endpoint."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import json
+
+from conftest import FakeAWSClient
+
+
+class FakeBatch(FakeAWSClient):
+    """Minimal stand-in for the AWS Batch client."""
+
+    def __init__(self, jobs, queue_exists=True):
+        self.jobs = jobs
+        self.queue_exists = queue_exists
+        self.calls = 0
+
+    def get_paginator(self, operation_name):
+        assert operation_name == 'list_jobs'
+        return self
+
+    def paginate(self, jobQueue, jobStatus, page_size=100):
+        """Yield list_jobs pages holding at most page_size summaries each."""
+        self.calls += 1
+        if not self.queue_exists:
+            raise self.exceptions.ClientException(f"JobQueue {jobQueue} not found")
+        count = self.jobs.get(jobStatus, 0)
+        for start in range(0, count, page_size):
+            yield {'jobSummaryList': [{'jobId': str(i)}
+                                      for i in range(start, min(count, start + page_size))]}
+
+
+def test_status_running(client, aws_clients):
+    """Test that running jobs are reported with the completed sample count."""
+    aws_clients(batch=FakeBatch(jobs={'RUNNING': 3, 'SUCCEEDED': 5}))
+    response = client.get("/api/status")
+    assert response.status_code == 200
+
+    data = json.loads(response.data)
+    assert data["status"] == "RUNNING"
+    assert data["completedSamples"] == 5
+
+
+def test_status_counts_all_pages(client, aws_clients):
+    """Test that job counts are not capped at a single list_jobs page."""
+    aws_clients(batch=FakeBatch(jobs={'SUCCEEDED': 250}))
+    response = client.get("/api/status")
+    data = json.loads(response.data)
+    assert data["status"] == "COMPLETED"
+    assert data["completedSamples"] == 250
+
+
+def test_status_ready(client, aws_clients):
+    """Test that an idle queue is reported as ready."""
+    aws_clients(batch=FakeBatch(jobs={}))
+    response = client.get("/api/status")
+    assert response.status_code == 200
+    assert json.loads(response.data)["status"] == "READY"
+
+
+def test_status_queue_not_found(client, aws_clients):
+    """Test that a missing job queue returns 404."""
+    aws_clients(batch=FakeBatch(jobs={}, queue_exists=False))
+    response = client.get("/api/status")
+    assert response.status_code == 404
+    assert json.loads(response.data)["status"] == "NOT_FOUND"
+
+
+def test_status_is_cached(client, aws_clients):
+    """Test that repeated polls are served from cache and honor If-None-Match."""
+    batch = FakeBatch(jobs={'RUNNING': 1})
+    aws_clients(batch=batch)
+    first = client.get("/api/status")
+    assert first.status_code == 200
+    assert first.headers.get("ETag")
+
+    second = client.get("/api/status")
+    assert second.data == first.data
+    assert batch.calls == 3  # one list_jobs walk per status, made only once
+
+    revalidated = client.get("/api/status", headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304
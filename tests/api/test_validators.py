@@ -0,0 +1,70 @@
+"""Test the API input validators."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import json
+
+import pytest
+from flask import Flask
+
+from api.validators import validate_json, is_positive_int
+
+
+@pytest.fixture
+def validated_client():
+    """Create a test client for an app with one validated endpoint."""
+    test_app = Flask(__name__)
+
+    @test_app.route('/echo', methods=['POST'])
+    @validate_json({'name': str, 'samples': is_positive_int})
+    def echo():
+        return {'ok': True}
+
+    return test_app.test_client()
+
+
+def test_valid_payload(validated_client):
+    """Test that a payload matching the schema reaches the endpoint."""
+    response = validated_client.post('/echo', json={'name': 'demo', 'samples': 10})
+    assert response.status_code == 200
+
+
+def test_missing_field(validated_client):
+    """Test that a missing required field is rejected."""
+    response = validated_client.post('/echo', json={'name': 'demo'})
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'] == 'Missing required field: samples'
+
+
+def test_invalid_type(validated_client):
+    """Test that type validators check the field type."""
+    response = validated_client.post('/echo', json={'name': 42, 'samples': 10})
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'].startswith('Invalid type for field: name')
+
+
+def test_invalid_value(validated_client):
+    """Test that function validators check the field value."""
+    response = validated_client.post('/echo', json={'name': 'demo', 'samples': 0})
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'] == 'Invalid value for field: samples'
+
+
+def test_missing_json(validated_client):
+    """Test that a request without a JSON body is rejected."""
+    response = validated_client.post('/echo', data='not json')
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'] == 'Missing JSON in request'
+
+
+def test_empty_schema_skips_body():
+    """Test that an empty schema accepts requests without a JSON body."""
+    test_app = Flask(__name__)
+
+    @test_app.route('/start', methods=['POST'])
+    @validate_json({})
+    def start():
+        return {'ok': True}
+
+    response = test_app.test_client().post('/start')
+    assert response.status_code == 200
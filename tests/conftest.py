@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 @pytest.fixture
 def app():
     """Create a Flask app for testing."""
-    from api.server import app as flask_app
+    from api.server import app as flask_app, describe_job_definition, invalidate_cached_response
     flask_app.config.update({
         "TESTING": True,
     })
@@ -27,6 +27,28 @@ def app():
     yield flask_app
     
     # Cleanup
+    invalidate_cached_response()
+    describe_job_definition.cache_clear()
+
+
+class FakeAWSClient:
+    """Base for fake boto3 clients, exposing the modeled exceptions the API catches."""
+
+    class exceptions:
+        class ClientException(Exception):
+            pass
+
+
+@pytest.fixture
+def aws_clients(monkeypatch):
+    """Patch the API's AWS client factory to return fakes by service name."""
+    from api import server
+
+    def install(**clients):
+        monkeypatch.setattr(server, "get_aws_client", clients.get)
+        return clients
+
+    return install
 
 
 @pytest.fixture
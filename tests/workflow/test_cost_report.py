@@ -0,0 +1,160 @@
+"""Test the cost report model and chart cache."""
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2025 Scott Friedman, All Rights Reserved.
+
+import argparse
+import importlib.util
+import os
+import sys
+
+import pytest
+
+COST_REPORT_PATH = os.path.join(os.path.dirname(__file__), '..', '..',
+                                'workflow', 'templates', 'cost_report.py')
+
+# Reports produced by the original cost model, before it was vectorized and memoized
+DEFAULT_REPORT = {
+    "aws": {
+        "total_cost": 1.215130666666667,
+        "compute_cost": 1.1384640000000004,
+        "storage_cost": 0.07666666666666666,
+        "runtime_hours": 0.25,
+        "instance_hours": 24.0,
+        "spot_percentage": 95,
+        "graviton_percentage": 90
+    },
+    "on_prem": {
+        "total_cost": 2688.0,
+        "compute_cost": 1612.8,
+        "maintenance_cost": 604.8000000000001,
+        "power_cooling_cost": 470.4,
+        "runtime_hours": 336,
+        "server_count": 4
+    },
+    "savings": {
+        "cost_savings": 2686.7848693333335,
+        "percentage_savings": 99.95479424603175,
+        "time_savings_hours": 335.75,
+        "time_savings_percentage": 99.92559523809523
+    }
+}
+
+CUSTOM_ARGS = {
+    "samples": 40,
+    "runtime_minutes": 90.0,
+    "spot_percentage": 50.0,
+    "graviton_percentage": 100.0,
+    "instance_count": 8
+}
+
+CUSTOM_REPORT = {
+    "aws": {
+        "total_cost": 0.7131466666666666,
+        "compute_cost": 0.6364799999999999,
+        "storage_cost": 0.07666666666666666,
+        "runtime_hours": 1.5,
+        "instance_hours": 7.199999999999999,
+        "spot_percentage": 50.0,
+        "graviton_percentage": 100.0
+    },
+    "on_prem": {
+        "total_cost": 672.0,
+        "compute_cost": 403.2,
+        "maintenance_cost": 151.20000000000002,
+        "power_cooling_cost": 117.6,
+        "runtime_hours": 336,
+        "server_count": 1
+    },
+    "savings": {
+        "cost_savings": 671.2868533333333,
+        "percentage_savings": 99.89387698412698,
+        "time_savings_hours": 334.5,
+        "time_savings_percentage": 99.55357142857143
+    }
+}
+
+
+
+@pytest.fixture
+def cost_report():
+    """Load the cost report template as a module."""
+    spec = importlib.util.spec_from_file_location("cost_report", COST_REPORT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def assert_report_matches(report, expected):
+    """Compare a cost report to expected values, allowing float summation noise."""
+    assert report.keys() == expected.keys()
+    for section, values in expected.items():
+        assert report[section] == pytest.approx(values, rel=1e-12)
+
+
+@pytest.fixture
+def run_report(cost_report, monkeypatch, tmp_path):
+    """Run the report's main() against tmp_path, recording chart renders."""
+    renders = []
+
+    def fake_generate_charts(cost_data, output_dir):
+        renders.append(output_dir)
+        for name in cost_report.CHART_FILES:
+            (tmp_path / name).write_bytes(b'png')
+
+    monkeypatch.setattr(cost_report, "generate_charts", fake_generate_charts)
+    monkeypatch.setattr(sys, "argv", ["cost_report.py", "--output-dir", str(tmp_path)])
+
+    def run():
+        cost_report.main()
+        return len(renders)
+
+    return run
+
+
+def test_current_charts_are_not_rendered_again(run_report):
+    """Test that a matching hash with every chart present skips rendering."""
+    assert run_report() == 1
+    assert run_report() == 1
+
+
+def test_missing_chart_is_rendered_again(run_report, cost_report, tmp_path):
+    """Test that a missing chart file triggers a re-render."""
+    run_report()
+    (tmp_path / cost_report.CHART_FILES[0]).unlink()
+
+    assert run_report() == 2
+
+
+def test_stale_hash_is_rendered_again(run_report, cost_report, tmp_path):
+    """Test that a different recorded digest triggers a re-render."""
+    run_report()
+    (tmp_path / cost_report.CHART_HASH_FILE).write_text("stale")
+
+    assert run_report() == 2
+
+
+def test_renderer_version_change_is_rendered_again(run_report, cost_report, monkeypatch):
+    """Test that bumping the renderer version invalidates existing charts."""
+    run_report()
+    monkeypatch.setattr(cost_report, "CHART_RENDER_VERSION", cost_report.CHART_RENDER_VERSION + 1)
+
+    assert run_report() == 2
+
+
+def test_calculate_costs_defaults(cost_report, monkeypatch):
+    """Test that the default arguments reproduce the original cost report."""
+    monkeypatch.setattr(sys, "argv", ["cost_report.py"])
+
+    assert_report_matches(cost_report.calculate_costs(cost_report.parse_arguments()),
+                          DEFAULT_REPORT)
+
+
+def test_calculate_costs_custom_parameters(cost_report):
+    """Test the cost model with non-default parameters and its memoization."""
+    args = argparse.Namespace(**CUSTOM_ARGS)
+
+    assert_report_matches(cost_report.calculate_costs(args), CUSTOM_REPORT)
+    assert cost_report.compute_cost_breakdown.cache_info().hits == 0
+
+    assert_report_matches(cost_report.calculate_costs(args), CUSTOM_REPORT)
+    assert cost_report.compute_cost_breakdown.cache_info().hits == 1
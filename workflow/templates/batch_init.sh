@@ -36,7 +36,7 @@ mkdir -p /tmp/results
 
 # Install Python dependencies
 echo "Installing Python dependencies..."
-pip3 install boto3 pandas numpy matplotlib >> /var/log/batch-init.log 2>&1
+pip3 install boto3 numpy matplotlib >> /var/log/batch-init.log 2>&1
 
 # Set up AWS region
 export AWS_DEFAULT_REGION="${AWS_BATCH_JOB_AWS_REGION:-us-east-1}"
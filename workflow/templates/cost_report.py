@@ -11,10 +11,17 @@ import sys
 import json
 import argparse
 import datetime
+import functools
+import hashlib
+import multiprocessing
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 # Constants for cost calculations
 COST_CONSTANTS = {
@@ -33,6 +40,40 @@ COST_CONSTANTS = {
     }
 }
 
+# Flat copies of the rates calculate_costs reads, resolved once at import
+AWS_GRAVITON_RATE = COST_CONSTANTS["aws"]["graviton3_cost_per_hour"]
+AWS_X86_RATE = COST_CONSTANTS["aws"]["x86_cost_per_hour"]
+AWS_SPOT_DISCOUNT = COST_CONSTANTS["aws"]["spot_discount"]
+AWS_S3_GB_MONTH_RATE = COST_CONSTANTS["aws"]["s3_cost_per_gb_month"]
+ON_PREM_SERVER_RATE = COST_CONSTANTS["on_prem"]["server_cost_per_hour"]
+ON_PREM_MAINTENANCE_RATE = COST_CONSTANTS["on_prem"]["maintenance_cost_per_hour"]
+ON_PREM_POWER_COOLING_RATE = COST_CONSTANTS["on_prem"]["power_cooling_per_hour"]
+
+# Hourly AWS rates per bucket: spot Graviton, spot x86, on-demand Graviton, on-demand x86
+AWS_HOURLY_RATES = np.array([
+    AWS_GRAVITON_RATE * (1 - AWS_SPOT_DISCOUNT),
+    AWS_X86_RATE * (1 - AWS_SPOT_DISCOUNT),
+    AWS_GRAVITON_RATE,
+    AWS_X86_RATE
+])
+
+# Combined hourly on-premises rate (server + maintenance + power & cooling)
+ON_PREM_HOURLY_RATE = ON_PREM_SERVER_RATE + ON_PREM_MAINTENANCE_RATE + ON_PREM_POWER_COOLING_RATE
+
+# Charts written by generate_charts, and the sidecar file recording the
+# digest of the cost data they were rendered from
+CHART_FILES = (
+    "cost_comparison.png",
+    "time_comparison.png",
+    "aws_cost_breakdown.png",
+    "onprem_cost_breakdown.png",
+)
+CHART_HASH_FILE = ".cost_report.hash"
+
+# Part of the chart digest; bump whenever the renderers change how charts are
+# drawn so existing output directories are re-rendered
+CHART_RENDER_VERSION = 2
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Generate cost report for Omics Demo')
@@ -48,76 +89,119 @@ def parse_arguments():
                       help='Percentage of instances using Graviton (default: 90)')
     parser.add_argument('--instance-count', type=int, default=160,
                       help='Maximum number of instances used (default: 160)')
+    parser.add_argument('--no-charts', action='store_true',
+                      help='Only write cost_report.json and skip chart generation')
     
     return parser.parse_args()
 
-def calculate_costs(args):
-    """Calculate costs for both on-premises and AWS approaches."""
+class CostBreakdown(NamedTuple):
+    """Numeric results of the cost model for one set of inputs."""
+    runtime_hours: float
+    instance_hours: float
+    aws_compute_cost: float
+    aws_storage_cost: float
+    aws_total_cost: float
+    onprem_runtime_hours: int
+    onprem_servers: int
+    onprem_server_cost: float
+    onprem_maintenance_cost: float
+    onprem_power_cooling_cost: float
+    onprem_total_cost: float
+
+@functools.lru_cache(maxsize=256)
+def compute_cost_breakdown(samples, runtime_minutes, spot_percentage, graviton_percentage,
+                           instance_count):
+    """Run the cost model for one set of inputs.
+    
+    Results are memoized, so parameter sweeps that revisit the same inputs
+    don't recompute them.
+    
+    Returns:
+        A CostBreakdown for the AWS and on-premises approaches
+    """
     # Convert runtime to hours for calculations
-    runtime_hours = args.runtime_minutes / 60
+    runtime_hours = runtime_minutes / 60
     
     # Calculate instance hours (scaled for actual usage patterns)
     # In reality, instances scale from 0 to max and back down
-    effective_instance_hours = args.instance_count * runtime_hours * 0.6  # ~60% avg utilization
+    effective_instance_hours = instance_count * runtime_hours * 0.6  # ~60% avg utilization
     
     # Calculate instance type distribution
-    spot_hours = effective_instance_hours * (args.spot_percentage / 100)
-    on_demand_hours = effective_instance_hours * (1 - args.spot_percentage / 100)
+    spot_hours = effective_instance_hours * (spot_percentage / 100)
+    on_demand_hours = effective_instance_hours * (1 - spot_percentage / 100)
     
-    graviton_hours = effective_instance_hours * (args.graviton_percentage / 100)
-    x86_hours = effective_instance_hours * (1 - args.graviton_percentage / 100)
+    graviton_hours = effective_instance_hours * (graviton_percentage / 100)
+    x86_hours = effective_instance_hours * (1 - graviton_percentage / 100)
     
     # Combine pricing models for total cost
-    spot_graviton_hours = spot_hours * (args.graviton_percentage / 100)
-    spot_x86_hours = spot_hours * (1 - args.graviton_percentage / 100)
-    od_graviton_hours = on_demand_hours * (args.graviton_percentage / 100)
-    od_x86_hours = on_demand_hours * (1 - args.graviton_percentage / 100)
-    
-    # Calculate AWS costs
-    graviton_cost = COST_CONSTANTS["aws"]["graviton3_cost_per_hour"]
-    x86_cost = COST_CONSTANTS["aws"]["x86_cost_per_hour"]
-    spot_discount = COST_CONSTANTS["aws"]["spot_discount"]
+    spot_graviton_hours = spot_hours * (graviton_percentage / 100)
+    spot_x86_hours = spot_hours * (1 - graviton_percentage / 100)
+    od_graviton_hours = on_demand_hours * (graviton_percentage / 100)
+    od_x86_hours = on_demand_hours * (1 - graviton_percentage / 100)
     
-    spot_graviton_cost = spot_graviton_hours * graviton_cost * (1 - spot_discount)
-    spot_x86_cost = spot_x86_hours * x86_cost * (1 - spot_discount)
-    od_graviton_cost = od_graviton_hours * graviton_cost
-    od_x86_cost = od_x86_hours * x86_cost
+    # Calculate AWS costs, with hours in the same bucket order as AWS_HOURLY_RATES
+    hours = np.array([spot_graviton_hours, spot_x86_hours, od_graviton_hours, od_x86_hours])
+    compute_cost = float(hours @ AWS_HOURLY_RATES)
     
     # Storage costs (rough estimate)
-    storage_cost = 100 * COST_CONSTANTS["aws"]["s3_cost_per_gb_month"] / 30  # 100GB for ~1 day
+    storage_cost = 100 * AWS_S3_GB_MONTH_RATE / 30  # 100GB for ~1 day
     
     # Total AWS cost
-    aws_cost = spot_graviton_cost + spot_x86_cost + od_graviton_cost + od_x86_cost + storage_cost
+    aws_cost = compute_cost + storage_cost
     
     # On-premises calculation - traditional approach
     # For 100 samples, typical on-prem time is ~2 weeks (336 hours)
     onprem_runtime_hours = 336  # 14 days * 24 hours
-    onprem_servers = max(1, int(args.samples / 25))  # 1 server per 25 samples
+    onprem_servers = max(1, int(samples / 25))  # 1 server per 25 samples
     
-    server_cost = onprem_servers * onprem_runtime_hours * COST_CONSTANTS["on_prem"]["server_cost_per_hour"]
-    maintenance_cost = onprem_servers * onprem_runtime_hours * COST_CONSTANTS["on_prem"]["maintenance_cost_per_hour"]
-    power_cooling_cost = onprem_servers * onprem_runtime_hours * COST_CONSTANTS["on_prem"]["power_cooling_per_hour"]
+    server_hours = onprem_servers * onprem_runtime_hours
+    server_cost = server_hours * ON_PREM_SERVER_RATE
+    maintenance_cost = server_hours * ON_PREM_MAINTENANCE_RATE
+    power_cooling_cost = server_hours * ON_PREM_POWER_COOLING_RATE
     
     # Total on-premises cost
-    onprem_cost = server_cost + maintenance_cost + power_cooling_cost
+    onprem_cost = server_hours * ON_PREM_HOURLY_RATE
+    
+    return CostBreakdown(
+        runtime_hours=runtime_hours,
+        instance_hours=effective_instance_hours,
+        aws_compute_cost=compute_cost,
+        aws_storage_cost=storage_cost,
+        aws_total_cost=aws_cost,
+        onprem_runtime_hours=onprem_runtime_hours,
+        onprem_servers=onprem_servers,
+        onprem_server_cost=server_cost,
+        onprem_maintenance_cost=maintenance_cost,
+        onprem_power_cooling_cost=power_cooling_cost,
+        onprem_total_cost=onprem_cost
+    )
+
+def calculate_costs(args):
+    """Calculate costs for both on-premises and AWS approaches."""
+    costs = compute_cost_breakdown(args.samples, args.runtime_minutes, args.spot_percentage,
+                                   args.graviton_percentage, args.instance_count)
+    runtime_hours = costs.runtime_hours
+    aws_cost = costs.aws_total_cost
+    onprem_runtime_hours = costs.onprem_runtime_hours
+    onprem_cost = costs.onprem_total_cost
     
     return {
         "aws": {
             "total_cost": aws_cost,
-            "compute_cost": spot_graviton_cost + spot_x86_cost + od_graviton_cost + od_x86_cost,
-            "storage_cost": storage_cost,
+            "compute_cost": costs.aws_compute_cost,
+            "storage_cost": costs.aws_storage_cost,
             "runtime_hours": runtime_hours,
-            "instance_hours": effective_instance_hours,
+            "instance_hours": costs.instance_hours,
             "spot_percentage": args.spot_percentage,
             "graviton_percentage": args.graviton_percentage
         },
         "on_prem": {
             "total_cost": onprem_cost,
-            "compute_cost": server_cost,
-            "maintenance_cost": maintenance_cost,
-            "power_cooling_cost": power_cooling_cost,
+            "compute_cost": costs.onprem_server_cost,
+            "maintenance_cost": costs.onprem_maintenance_cost,
+            "power_cooling_cost": costs.onprem_power_cooling_cost,
             "runtime_hours": onprem_runtime_hours,
-            "server_count": onprem_servers
+            "server_count": costs.onprem_servers
         },
         "savings": {
             "cost_savings": onprem_cost - aws_cost,
@@ -127,67 +211,97 @@ def calculate_costs(args):
         }
     }
 
-def generate_charts(cost_data, output_dir):
-    """Generate charts for the cost report."""
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+def load_pyplot():
+    """Import matplotlib's pyplot, rendering straight to files with the Agg backend."""
+    # Imported here so JSON-only runs and --help never load matplotlib
+    import matplotlib
+    matplotlib.use('Agg')  # No display needed
+    import matplotlib.pyplot as plt
+    return plt
+
+def percent_labels(labels, values):
+    """Append each value's share of the total to its pie chart label."""
+    total = sum(values)
+    return [f"{label}\n{100 * value / total:.1f}%" for label, value in zip(labels, values)]
+
+def render_cost_comparison(cost_data, path):
+    """Render the AWS vs on-premises cost bar chart."""
+    plt = load_pyplot()
+    # Constrained layout fits the labels and callout in a single layout pass,
+    # without the extra render that bbox_inches='tight' costs
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+    # The layout engine ignores the callout's bbox padding, so reserve it
+    fig.get_layout_engine().set(h_pad=0.1)
     
-    # Cost comparison chart
-    plt.figure(figsize=(10, 6))
     labels = ['AWS', 'On-Premises']
     costs = [cost_data['aws']['total_cost'], cost_data['on_prem']['total_cost']]
     colors = ['#FF9900', '#232F3E']  # AWS colors
     
-    plt.bar(labels, costs, color=colors)
-    plt.title('Cost Comparison: AWS vs On-Premises')
-    plt.ylabel('Cost (USD)')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.bar(labels, costs, color=colors)
+    ax.set_title('Cost Comparison: AWS vs On-Premises')
+    ax.set_ylabel('Cost (USD)')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Add cost values on top of bars
     for i, cost in enumerate(costs):
-        plt.text(i, cost + 50, f'${cost:.2f}', ha='center', fontweight='bold')
+        ax.text(i, cost + 50, f'${cost:.2f}', ha='center', fontweight='bold')
     
     # Add savings callout
     savings_pct = cost_data['savings']['percentage_savings']
-    plt.figtext(0.5, 0.01, f'Cost Savings: ${cost_data["savings"]["cost_savings"]:.2f} ({savings_pct:.1f}%)',
-                ha='center', fontsize=12, bbox={'facecolor':'#E6F2F8', 'alpha':0.8, 'pad':5})
+    fig.supxlabel(f'Cost Savings: ${cost_data["savings"]["cost_savings"]:.2f} ({savings_pct:.1f}%)',
+                  fontsize=12, bbox={'facecolor':'#E6F2F8', 'alpha':0.8, 'pad':5})
     
-    plt.savefig(f'{output_dir}/cost_comparison.png', dpi=300, bbox_inches='tight')
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+def render_time_comparison(cost_data, path):
+    """Render the AWS vs on-premises runtime bar chart."""
+    plt = load_pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+    fig.get_layout_engine().set(h_pad=0.1)
     
-    # Time comparison chart
-    plt.figure(figsize=(10, 6))
     labels = ['AWS', 'On-Premises']
     times = [cost_data['aws']['runtime_hours'], cost_data['on_prem']['runtime_hours']]
+    colors = ['#FF9900', '#232F3E']  # AWS colors
     
-    plt.bar(labels, times, color=colors)
-    plt.title('Time Comparison: AWS vs On-Premises')
-    plt.ylabel('Runtime (hours)')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.bar(labels, times, color=colors)
+    ax.set_title('Time Comparison: AWS vs On-Premises')
+    ax.set_ylabel('Runtime (hours)')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Add time values on top of bars
     for i, time in enumerate(times):
-        plt.text(i, time + 10, f'{time:.1f} hours', ha='center', fontweight='bold')
+        ax.text(i, time + 10, f'{time:.1f} hours', ha='center', fontweight='bold')
     
     # Add time savings callout
     time_savings_pct = cost_data['savings']['time_savings_percentage']
-    plt.figtext(0.5, 0.01, 
-                f'Time Savings: {cost_data["savings"]["time_savings_hours"]:.1f} hours ({time_savings_pct:.1f}%)',
-                ha='center', fontsize=12, bbox={'facecolor':'#E6F2F8', 'alpha':0.8, 'pad':5})
+    time_savings_hours = cost_data['savings']['time_savings_hours']
+    fig.supxlabel(f'Time Savings: {time_savings_hours:.1f} hours ({time_savings_pct:.1f}%)',
+                  fontsize=12, bbox={'facecolor':'#E6F2F8', 'alpha':0.8, 'pad':5})
     
-    plt.savefig(f'{output_dir}/time_comparison.png', dpi=300, bbox_inches='tight')
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+def render_aws_breakdown(cost_data, path):
+    """Render the AWS cost breakdown pie chart."""
+    plt = load_pyplot()
+    fig, ax = plt.subplots(figsize=(8, 8), constrained_layout=True)
     
-    # Cost breakdown chart for AWS
-    plt.figure(figsize=(8, 8))
     aws_labels = ['Compute', 'Storage']
     aws_costs = [cost_data['aws']['compute_cost'], cost_data['aws']['storage_cost']]
     
-    plt.pie(aws_costs, labels=aws_labels, autopct='%1.1f%%', startangle=90, colors=['#FF9900', '#146EB4'])
-    plt.axis('equal')
-    plt.title('AWS Cost Breakdown')
-    plt.savefig(f'{output_dir}/aws_cost_breakdown.png', dpi=300, bbox_inches='tight')
+    ax.pie(aws_costs, labels=percent_labels(aws_labels, aws_costs), startangle=90,
+           colors=['#FF9900', '#146EB4'])
+    ax.set_aspect('equal')
+    ax.set_title('AWS Cost Breakdown')
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+def render_onprem_breakdown(cost_data, path):
+    """Render the on-premises cost breakdown pie chart."""
+    plt = load_pyplot()
+    fig, ax = plt.subplots(figsize=(8, 8), constrained_layout=True)
     
-    # Cost breakdown chart for on-premises
-    plt.figure(figsize=(8, 8))
     onprem_labels = ['Servers', 'Maintenance', 'Power & Cooling']
     onprem_costs = [
         cost_data['on_prem']['compute_cost'], 
@@ -195,23 +309,86 @@ def generate_charts(cost_data, output_dir):
         cost_data['on_prem']['power_cooling_cost']
     ]
     
-    plt.pie(onprem_costs, labels=onprem_labels, autopct='%1.1f%%', startangle=90, 
-            colors=['#232F3E', '#7D8998', '#99BCE3'])
-    plt.axis('equal')
-    plt.title('On-Premises Cost Breakdown')
-    plt.savefig(f'{output_dir}/onprem_cost_breakdown.png', dpi=300, bbox_inches='tight')
+    ax.pie(onprem_costs, labels=percent_labels(onprem_labels, onprem_costs), startangle=90,
+           colors=['#232F3E', '#7D8998', '#99BCE3'])
+    ax.set_aspect('equal')
+    ax.set_title('On-Premises Cost Breakdown')
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+# Chart renderers, in the same order as CHART_FILES
+CHART_RENDERERS = (
+    render_cost_comparison,
+    render_time_comparison,
+    render_aws_breakdown,
+    render_onprem_breakdown,
+)
+
+def render_chart(renderer, cost_data, path):
+    """Run one chart renderer; the entry point for chart worker processes."""
+    renderer(cost_data, path)
+
+def generate_charts(cost_data, output_dir):
+    """Generate charts for the cost report.
+    
+    Rasterization dominates chart time and the charts are independent, so
+    each one is rendered in its own worker process.
+    """
+    # Create output directory if it doesn't exist
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Load matplotlib before forking so workers inherit it instead of
+    # importing it again; macOS and Windows keep their default (spawn),
+    # since forking after these imports is only safe on Linux
+    load_pyplot()
+    start_method = 'fork' if sys.platform.startswith('linux') else None
+    context = multiprocessing.get_context(start_method)
+    
+    jobs = [
+        (renderer, cost_data, f'{output_dir}/{name}')
+        for renderer, name in zip(CHART_RENDERERS, CHART_FILES)
+    ]
+    with context.Pool(processes=len(jobs)) as pool:
+        pool.starmap(render_chart, jobs)
+
+def cost_data_digest(cost_data):
+    """Return the chart cache key for the cost data and renderer version."""
+    digest = hashlib.blake2b(f"{CHART_RENDER_VERSION}:".encode())
+    digest.update(json.dumps(cost_data, sort_keys=True).encode())
+    return digest.hexdigest()
+
+def charts_are_current(digest, output_dir):
+    """Check whether output_dir already holds charts rendered from data with this digest."""
+    hash_path = Path(output_dir) / CHART_HASH_FILE
+    if not hash_path.is_file() or hash_path.read_text().strip() != digest:
+        return False
+    return all((Path(output_dir) / name).is_file() for name in CHART_FILES)
+
+def dump_report(cost_data):
+    """Serialize the cost report as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(cost_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(cost_data, indent=2).encode()
 
 def main():
     """Main function."""
     args = parse_arguments()
     cost_data = calculate_costs(args)
     
-    # Generate report
-    generate_charts(cost_data, args.output_dir)
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Generate report, unless the charts already reflect this data
+    if not args.no_charts:
+        digest = cost_data_digest(cost_data)
+        if charts_are_current(digest, args.output_dir):
+            print("Charts are up to date, skipping chart generation")
+        else:
+            generate_charts(cost_data, args.output_dir)
+            (Path(args.output_dir) / CHART_HASH_FILE).write_text(digest)
     
     # Save the data as JSON
-    with open(f'{args.output_dir}/cost_report.json', 'w') as f:
-        json.dump(cost_data, f, indent=2)
+    with open(f'{args.output_dir}/cost_report.json', 'wb') as f:
+        f.write(dump_report(cost_data))
     
     # Print summary to stdout
     print("Cost Report Summary:")